@@ -0,0 +1,139 @@
+"""Tools for the evaluation of functions."""
+
+import collections
+import functools
+import math
+import time
+
+
+class CachedFunction:
+    """Memoize the evaluations of an expensive function.
+
+    The wrapped function can be passed to any method in place of the
+    original one. The results are kept in a bounded LRU cache whose keys
+    are the arguments of the call, optionally rounded to the nearest
+    multiple of 'quantum' so that nearby arguments share one evaluation.
+    Calls with unhashable arguments (e.g. arrays) are not cached.
+
+    Args:
+        f (function): function to be cached.
+        maxsize (int): maximum number of cached evaluations (None for an
+            unbounded cache).
+        quantum (float): resolution of the keys (None for exact keys).
+
+    Attributes:
+        hits (int): number of calls answered by the cache.
+        misses (int): number of calls that evaluated 'f'.
+    """
+
+    def __init__(self, f, maxsize=1024, quantum=None):
+        self.f = f
+        self.maxsize = maxsize
+        self.quantum = quantum
+        self.hits = 0
+        self.misses = 0
+        self._cache = collections.OrderedDict()
+
+    def _key(self, args):
+        if self.quantum is None:
+            return args
+        return tuple(self._quantize(arg) for arg in args)
+
+    def _quantize(self, arg):
+        if not isinstance(arg, (int, float)):
+            return arg
+        q = arg / self.quantum
+        # NaN and infinite values cannot be rounded, they are kept exact
+        return round(q) if math.isfinite(q) else arg
+
+    def __call__(self, *args):
+        key = self._key(args)
+        try:
+            value = self._cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments
+            self.misses += 1
+            return self.f(*args)
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = self.f(*args)
+        self._cache[key] = value
+        if self.maxsize is not None and len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Remove all the cached evaluations and reset the counters."""
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class Profiler:
+    """Count the calls and measure the time spent in functions.
+
+    Any function given to a method (f, df, the right-hand side of an ODE)
+    or the method itself can be wrapped by 'wrap'. When used as a context
+    manager, the total elapsed time inside the block is also recorded.
+
+    Attributes:
+        elapsed (float): time spent inside the 'with' block, in seconds.
+    """
+
+    def __init__(self):
+        self.elapsed = 0.0
+        self._stats = {}
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.elapsed += time.perf_counter() - self._start
+        self._start = None
+
+    def wrap(self, f, name=None):
+        """Wrap a function so that its calls are recorded.
+
+        Args:
+            f (function): function to be instrumented.
+            name (str): name of the records (the name of 'f' by default).
+                Functions wrapped with the same name share the records.
+
+        Returns:
+            wrapper (function): instrumented function.
+        """
+        if name is None:
+            name = getattr(f, "__name__", repr(f))
+        stats = self._stats.setdefault(name, {"calls": 0, "time": 0.0})
+
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                stats["calls"] += 1
+                stats["time"] += time.perf_counter() - start
+
+        return wrapper
+
+    def as_dict(self):
+        """Export the records.
+
+        Returns:
+            stats (dict): the elapsed time and, for each name, the number
+                of calls and the time spent in them.
+        """
+        return {
+            "elapsed": self.elapsed,
+            "functions": {name: dict(stats)
+                          for name, stats in self._stats.items()},
+        }
@@ -2,6 +2,9 @@
 
 import numpy as np
 
+import linear_systems
+import polynomials
+
 
 def lagrange(x, y, x_int):
     """Interpolates a value using the 'Lagrange polynomial'.
@@ -9,10 +12,10 @@ def lagrange(x, y, x_int):
     Args:
         x (numpy.ndarray): x values.
         y (numpy.ndarray): y values.
-        x_int (float): value to interpolate.
+        x_int (float or numpy.ndarray): values to interpolate.
 
     Returns:
-        y_int (float): interpolated value.
+        y_int (float or numpy.ndarray): interpolated values.
     """
     m = x.size
     y_int = 0
@@ -27,24 +30,84 @@ def lagrange(x, y, x_int):
     return y_int
 
 
+class BarycentricLagrange:
+    """Lagrange polynomial in the barycentric form.
+
+    The O(m^2) barycentric weights are computed once, then each value is
+    interpolated in O(m).
+
+    Args:
+        x (numpy.ndarray): x values.
+        y (numpy.ndarray): y values.
+
+    Attributes:
+        w (numpy.ndarray): barycentric weights.
+        block_size (int): number of values interpolated at once.
+    """
+
+    block_size = 1024
+
+    def __init__(self, x, y):
+        if x.size != y.size:
+            raise ValueError("'x' and 'y' must have same size.")
+
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+
+        # The differences are scaled to avoid overflow of the products
+        scale = (self.x.max() - self.x.min()) / 4 or 1.0
+        diff = (self.x[:, None] - self.x[None, :]) / scale
+        np.fill_diagonal(diff, 1.0)
+        self.w = 1 / np.prod(diff, axis=1)
+
+    def __call__(self, x_int):
+        """Interpolate values.
+
+        The values are processed in blocks of 'block_size', so the memory
+        used is O(block_size * m) for any number of values.
+
+        Args:
+            x_int (float or numpy.ndarray): values to interpolate.
+
+        Returns:
+            y_int (float or numpy.ndarray): interpolated values.
+        """
+        t = np.asarray(x_int, dtype=float)
+        t_flat = t.reshape(-1)
+        y_int = np.empty(t_flat.size)
+
+        for start in range(0, t_flat.size, self.block_size):
+            stop = start + self.block_size
+            diff = t_flat[start:stop, None] - self.x
+
+            # Values that coincide with a node are taken directly from 'y'
+            exact = diff == 0
+            diff[exact] = 1.0
+            c = self.w / diff
+            y_int[start:stop] = (c @ self.y) / c.sum(axis=1)
+
+            row, col = np.nonzero(exact)
+            y_int[start + row] = self.y[col]
+
+        y_int = y_int.reshape(t.shape)
+        return float(y_int) if y_int.ndim == 0 else y_int
+
+
 def newton(x, y, x_int):
     """Interpolates a value using the 'Newton polynomial'.
 
     Args:
         x (numpy.ndarray): x values.
         y (numpy.ndarray): y values.
-        x_int (float): value to interpolate.
+        x_int (float or numpy.ndarray): values to interpolate.
 
     Returns:
-        y_int (float): interpolated value.
+        y_int (float or numpy.ndarray): interpolated values.
     """
     m = x.size
-    del_y = y.copy()
 
     # Calculate the divided differences
-    for k in range(1, m):
-        for i in range(m - 1, k - 1, -1):
-            del_y[i] = (del_y[i] - del_y[i - 1]) / (x[i] - x[i - k])
+    del_y = polynomials.newton_divided_difference(x, y)
 
     # Evaluate the polynomial by Horner's method
     y_int = del_y[-1]
@@ -54,16 +117,170 @@ def newton(x, y, x_int):
     return y_int
 
 
+class NewtonInterpolant:
+    """Newton polynomial with cached divided differences.
+
+    The divided differences are computed once, then any number of values
+    can be interpolated. A new node can be added in O(m) from the last row
+    of the divided-difference table, without recomputing it.
+
+    Args:
+        x (numpy.ndarray): x values.
+        y (numpy.ndarray): y values.
+
+    Attributes:
+        coef (numpy.ndarray): Newton's divided difference coefficients.
+    """
+
+    def __init__(self, x, y):
+        if x.size != y.size:
+            raise ValueError("'x' and 'y' must have same size.")
+
+        self.x = np.array(x, dtype=float)
+        self.coef = np.array(y, dtype=float)
+        m = self.x.size
+
+        # Last row of the divided-difference table, f[x_{m-1-k}..x_{m-1}]
+        self._row = np.zeros(m)
+        self._row[0] = self.coef[-1]
+
+        # Calculate the divided differences, one column at a time
+        for k in range(1, m):
+            self.coef[k:] = (self.coef[k:] - self.coef[k - 1:-1]) / \
+                (self.x[k:] - self.x[:-k])
+            self._row[k] = self.coef[-1]
+
+    def __call__(self, x_int):
+        """Interpolate values.
+
+        Args:
+            x_int (float or numpy.ndarray): values to interpolate.
+
+        Returns:
+            y_int (float or numpy.ndarray): interpolated values.
+        """
+        # Evaluate the polynomial by Horner's method
+        y_int = self.coef[-1]
+        for i in range(self.x.size - 2, -1, -1):
+            y_int = y_int * (x_int - self.x[i]) + self.coef[i]
+
+        return y_int
+
+    def add_point(self, x_new, y_new):
+        """Add a node to the polynomial.
+
+        Args:
+            x_new (float): x value.
+            y_new (float): y value.
+        """
+        if np.any(self.x == x_new):
+            raise ValueError("'x_new' must be different from the x values.")
+
+        m = self.x.size
+        self.x = np.append(self.x, x_new)
+
+        row = np.zeros(m + 1)
+        row[0] = y_new
+        for k in range(1, m + 1):
+            row[k] = (row[k - 1] - self._row[k - 1]) / \
+                (x_new - self.x[m - k])
+
+        self._row = row
+        self.coef = np.append(self.coef, row[m])
+
+
+class ChebyshevInterpolant:
+    """Chebyshev polynomial interpolating a function in [a, b].
+
+    The function is sampled at Chebyshev points, doubling their number
+    (and reusing the previous samples) until the tail of the Chebyshev
+    coefficients decays below the tolerance. The coefficients are found by
+    a discrete cosine transform computed with the FFT, and the polynomial
+    is evaluated by the Clenshaw recurrence.
+
+    Args:
+        f (function): vectorized equation f(x).
+        a (float): the initial point.
+        b (float): the final point.
+        toler (float): relative tolerance of the coefficients.
+        n_max (int): maximum degree of the polynomial.
+
+    Attributes:
+        coef (numpy.ndarray): Chebyshev coefficients.
+        n_eval (int): number of evaluations of 'f'.
+        converged (boolean): flag to indicate if the tolerance was reached.
+    """
+
+    def __init__(self, f, a, b, toler=1e-13, n_max=2 ** 16):
+        self.a = a
+        self.b = b
+
+        n = 16
+        fx = self._values(f, np.arange(0, n + 1), n)
+        self.n_eval = n + 1
+
+        while True:
+            # Discrete cosine transform (type I) by the FFT
+            c = np.fft.rfft(np.concatenate((fx, fx[-2:0:-1]))).real / n
+            c[0] /= 2
+            c[n] /= 2
+
+            scale = np.max(np.fabs(c))
+            tail = np.max(np.fabs(c[-3:]))
+            self.converged = tail <= toler * scale
+            if self.converged or 2 * n > n_max:
+                break
+
+            # The points of degree 'n' are the even points of degree '2n'
+            fx_new = np.zeros(2 * n + 1)
+            fx_new[0::2] = fx
+            fx_new[1::2] = self._values(f, np.arange(1, 2 * n, 2), 2 * n)
+            self.n_eval += n
+            fx = fx_new
+            n *= 2
+
+        # Chop the negligible coefficients
+        big = np.nonzero(np.fabs(c) > toler * scale)[0]
+        self.coef = c[:big[-1] + 1] if big.size > 0 else c[:1]
+
+    def _values(self, f, j, n):
+        """Evaluate 'f' at the Chebyshev points x_j of degree 'n'."""
+        s = np.cos(np.pi * j / n)
+        return np.asarray(f((self.a + self.b) / 2 + (self.b - self.a) / 2 * s),
+                          dtype=float) * np.ones(j.size)
+
+    def __call__(self, x_int):
+        """Interpolate values.
+
+        Args:
+            x_int (float or numpy.ndarray): values to interpolate.
+
+        Returns:
+            y_int (float or numpy.ndarray): interpolated values.
+        """
+        s = (2 * np.asarray(x_int, dtype=float) - self.a - self.b) / \
+            (self.b - self.a)
+
+        # Clenshaw recurrence
+        b1 = np.zeros(s.shape)
+        b2 = np.zeros(s.shape)
+        for c in self.coef[:0:-1]:
+            b1, b2 = c + 2 * s * b1 - b2, b1
+        y_int = self.coef[0] + s * b1 - b2
+
+        return float(y_int) if y_int.ndim == 0 else y_int
+
+
 def gregory_newton(x, y, x_int):
     """Interpolates a value using the 'Gregory-Newton polynomial'.
 
     Args:
         x (numpy.ndarray): x values.
         y (numpy.ndarray): y values.
-        x_int (float): value to interpolate.
+        x_int (float or numpy.ndarray): values to interpolate.
 
     Returns:
-        y_int (float): interpolated value.
+        y_int (float or numpy.ndarray): interpolated values.
     """
     m = x.size
     del_y = y.copy()
@@ -82,28 +299,260 @@ def gregory_newton(x, y, x_int):
     return y_int
 
 
-def neville(x, y, x_int):
+class GregoryNewtonInterpolant:
+    """Gregory-Newton polynomial with a cached finite-difference table.
+
+    The finite differences of equally spaced data are computed once, then
+    any number of values can be interpolated. The window of nodes can slide
+    forward by one sample in O(m), which suits streaming data.
+
+    Args:
+        x (numpy.ndarray): x values, equally spaced.
+        y (numpy.ndarray): y values.
+
+    Attributes:
+        coef (numpy.ndarray): forward differences of the first node.
+    """
+
+    def __init__(self, x, y):
+        if x.size != y.size:
+            raise ValueError("'x' and 'y' must have same size.")
+
+        m = x.size
+        self.x0 = float(x[0])
+        self.h = float(x[1] - x[0])
+        self.coef = np.zeros(m)
+
+        # Backward differences of the last node
+        self._row = np.zeros(m)
+
+        # Calculate the finite differences
+        del_y = np.asarray(y, dtype=float)
+        for k in range(0, m):
+            self.coef[k] = del_y[0]
+            self._row[k] = del_y[-1]
+            del_y = np.diff(del_y)
+
+    def __call__(self, x_int):
+        """Interpolate values.
+
+        Args:
+            x_int (float or numpy.ndarray): values to interpolate.
+
+        Returns:
+            y_int (float or numpy.ndarray): interpolated values.
+        """
+        # Evaluate the polynomial by Horner's method
+        u = (x_int - self.x0) / self.h
+        y_int = self.coef[-1]
+        for i in range(self.coef.size - 2, -1, -1):
+            y_int = y_int * (u - i) / (i + 1) + self.coef[i]
+
+        return y_int
+
+    def slide(self, y_new):
+        """Drop the first node and add a node after the last one.
+
+        Args:
+            y_new (float): y value of the new node, at x[-1] + h.
+        """
+        row = np.zeros(self.coef.size)
+        row[0] = y_new
+        row[1:] = y_new - np.cumsum(self._row[:-1])
+
+        self.coef[:-1] = self.coef[:-1] + self.coef[1:]
+        self.coef[-1] = row[-1]
+        self._row = row
+        self.x0 += self.h
+
+
+def neville(x, y, x_int, table=True):
     """Interpolates a value using the 'Neville polynomial'.
 
     Args:
         x (numpy.ndarray): x values.
         y (numpy.ndarray): y values.
-        x_int (float): value to interpolate.
+        x_int (float or numpy.ndarray): values to interpolate.
+        table (boolean): flag to return the coefficients matrix. If False,
+            only one column of the matrix is kept in memory and only
+            'y_int' is returned.
 
     Returns:
-        y_int (float): interpolated value.
-        q (numpy.ndarray): coefficients matrix.
+        y_int (float or numpy.ndarray): interpolated values.
+        q (numpy.ndarray): coefficients matrix (for an array 'x_int', the
+            trailing axes index the values to interpolate).
     """
     n = x.size
-    q = np.zeros((n, n - 1))
+    x_int = np.asarray(x_int, dtype=float)
+
+    # 'x' and 'y' as columns, broadcast against the values to interpolate
+    x = x.reshape((n,) + (1,) * x_int.ndim)
+    y = y.reshape(x.shape)
+
+    if not table:
+        # Only the last computed column of the matrix 'q'
+        p = y * np.ones(x_int.shape)
+        for j in range(1, n):
+            p[j:] = ((x_int - x[:-j]) * p[j:] -
+                     (x_int - x[j:]) * p[j - 1:-1]) / (x[j:] - x[:-j])
+
+        y_int = p[n - 1]
+        return y_int
+
+    q = np.zeros((n, n) + x_int.shape)
 
     # Insert 'y' in the first column of the matrix 'q'
-    q = np.concatenate((y[:, None], q), axis=1)
+    q[:, 0] = y
 
-    for i in range(1, n):
-        for j in range(1, i + 1):
-            q[i, j] = ((x_int - x[i - j]) * q[i, j - 1] -
-                       (x_int - x[i]) * q[i - 1, j - 1]) / (x[i] - x[i - j])
+    for j in range(1, n):
+        q[j:, j] = ((x_int - x[:-j]) * q[j:, j - 1] -
+                    (x_int - x[j:]) * q[j - 1:-1, j - 1]) / (x[j:] - x[:-j])
 
     y_int = q[n - 1, n - 1]
     return y_int, q
+
+
+def piecewise_neville(x, y, x_int, k=4):
+    """Interpolates values using 'Neville polynomials' of local nodes.
+
+    For each value, a window of the 'k' nodes around it is located by a
+    binary search and only these nodes are used by the Neville method, so
+    the cost per value does not depend on the number of nodes.
+
+    Args:
+        x (numpy.ndarray): x values, in ascending order.
+        y (numpy.ndarray): y values.
+        x_int (float or numpy.ndarray): values to interpolate.
+        k (int): number of nodes of each window (k-1 is the degree).
+
+    Returns:
+        y_int (float or numpy.ndarray): interpolated values.
+    """
+    if x.size != y.size:
+        raise ValueError("'x' and 'y' must have same size.")
+
+    if not 1 <= k <= x.size:
+        raise ValueError("'k' must be between 1 and the number of nodes.")
+
+    x_int = np.asarray(x_int, dtype=float)
+    t = x_int.reshape(-1, 1)
+
+    # Windows of nodes, one row for each value to interpolate
+    start = np.searchsorted(x, x_int.ravel()) - k // 2
+    start = np.clip(start, 0, x.size - k)
+    window = start[:, None] + np.arange(0, k)
+    xw = x[window].astype(float)
+    p = y[window].astype(float)
+
+    # Neville method, keeping only the last computed column
+    for j in range(1, k):
+        p[:, j:] = ((t - xw[:, :-j]) * p[:, j:] -
+                    (t - xw[:, j:]) * p[:, j - 1:-1]) / \
+            (xw[:, j:] - xw[:, :-j])
+
+    y_int = p[:, -1].reshape(x_int.shape)
+    return float(y_int) if y_int.ndim == 0 else y_int
+
+
+class CubicSpline:
+    """Cubic spline interpolation.
+
+    The second derivatives at the nodes are found by solving a tridiagonal
+    system in O(n), and each value is interpolated in O(log n) by locating
+    its interval with a binary search. Instances can be pickled, so a
+    fitted spline can be sent to other processes.
+
+    Args:
+        x (numpy.ndarray): x values, in ascending order.
+        y (numpy.ndarray): y values.
+        bc (str): boundary condition, 'natural', 'clamped' or 'not-a-knot'.
+        dy (tuple): first derivatives at the ends (only for 'clamped').
+
+    Attributes:
+        m (numpy.ndarray): second derivatives at the nodes.
+    """
+
+    def __init__(self, x, y, bc="natural", dy=(0.0, 0.0)):
+        if x.size != y.size:
+            raise ValueError("'x' and 'y' must have same size.")
+
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        n = self.x.size
+        h = np.diff(self.x)
+
+        if n < 2 or (bc == "not-a-knot" and n < 4):
+            raise ValueError("Not enough nodes for this boundary condition.")
+
+        if np.any(h <= 0):
+            raise ValueError("'x' must be in strictly ascending order.")
+
+        # Equations of the second derivatives at the nodes
+        slope = np.diff(self.y) / h
+        lower = np.concatenate((h[:-1], [0.0]))
+        diag = np.concatenate(([1.0], 2 * (h[:-1] + h[1:]), [1.0]))
+        upper = np.concatenate(([0.0], h[1:]))
+        d = np.concatenate(([0.0], 6 * np.diff(slope), [0.0]))
+
+        if bc == "natural":
+            self.m = linear_systems.tridiagonal(lower, diag, upper, d)
+        elif bc == "clamped":
+            diag[0] = 2 * h[0]
+            upper[0] = h[0]
+            d[0] = 6 * (slope[0] - dy[0])
+            diag[-1] = 2 * h[-1]
+            lower[-1] = h[-1]
+            d[-1] = 6 * (dy[1] - slope[-1])
+            self.m = linear_systems.tridiagonal(lower, diag, upper, d)
+        elif bc == "not-a-knot":
+            # The third derivative is continuous at x[1] and x[n-2]. The
+            # first and last second derivatives are eliminated, which keeps
+            # the system of the interior nodes tridiagonal.
+            lower = lower[1:-1].copy()
+            diag = diag[1:-1].copy()
+            upper = upper[1:-1].copy()
+            d = d[1:-1]
+            h0, h1 = h[0], h[1]
+            diag[0] = (h0 + h1) * (h0 + 2 * h1) / h1
+            upper[0] = (h1 - h0) * (h1 + h0) / h1
+            hb, ha = h[-1], h[-2]
+            lower[-1] = (ha - hb) * (ha + hb) / ha
+            diag[-1] = (ha + hb) * (2 * ha + hb) / ha
+            m = linear_systems.tridiagonal(lower, diag, upper, d)
+            m0 = ((h0 + h1) * m[0] - h0 * m[1]) / h1
+            mn = ((ha + hb) * m[-1] - hb * m[-2]) / ha
+            self.m = np.concatenate(([m0], m, [mn]))
+        else:
+            raise ValueError("'bc' must be 'natural', 'clamped' or "
+                             "'not-a-knot'.")
+
+        # Coefficients of the cubic polynomial of each interval
+        self._c = np.array([
+            self.y[:-1],
+            slope - h * (2 * self.m[:-1] + self.m[1:]) / 6,
+            self.m[:-1] / 2,
+            np.diff(self.m) / (6 * h),
+        ])
+
+    def __call__(self, x_int):
+        """Interpolate values.
+
+        Values outside [x[0], x[n-1]] are extrapolated by the polynomials
+        of the first and last intervals.
+
+        Args:
+            x_int (float or numpy.ndarray): values to interpolate.
+
+        Returns:
+            y_int (float or numpy.ndarray): interpolated values.
+        """
+        x_int = np.asarray(x_int, dtype=float)
+        i = np.searchsorted(self.x, x_int, side="right") - 1
+        i = np.clip(i, 0, self.x.size - 2)
+
+        # Evaluate the polynomial by Horner's method
+        t = x_int - self.x[i]
+        c = self._c[:, i]
+        y_int = ((c[3] * t + c[2]) * t + c[1]) * t + c[0]
+
+        return float(y_int) if y_int.ndim == 0 else y_int
@@ -2,6 +2,8 @@
 
 import math
 
+import numpy as np
+
 
 def limit_epsilon_delta(f, x, toler, iter_max):
     """Calculate a limit using the epsilon-delta definition.
@@ -38,3 +40,135 @@ def limit_epsilon_delta(f, x, toler, iter_max):
         raise ValueError("Two sided limit does not exist.")
 
     return limit_low, i, converged
+
+
+def limit_epsilon_delta_batch(f, x, toler, iter_max, args=()):
+    """Calculate limits at many points using the epsilon-delta definition.
+
+    All the points x[k] are processed at the same time. At each iteration
+    'f' is only evaluated at the points still active, whose parameters
+    are given in 'args' and passed along with 'x'. Instead of raising an
+    error, the points where the two sided limit does not exist get a 'nan'
+    limit.
+
+    Args:
+        f (function): vectorized equation f(x, *args).
+        x (numpy.ndarray): the values the independent variable is
+            approaching.
+        toler (float): tolerance (stopping criterion).
+        iter_max (int): maximum number of iterations (stopping criterion).
+        args (tuple): parameters of the equation, each one an array with
+            the shape of 'x' (or broadcastable to it).
+
+    Returns:
+        limit (numpy.ndarray): the limit values.
+        iter (numpy.ndarray): number of iterations used in each point.
+        converged (numpy.ndarray): flags to indicate if each limit was found.
+    """
+    x = np.asarray(x, dtype=float)
+    shape = x.shape
+    x = x.reshape(-1)
+    args = [np.broadcast_to(arg, shape).reshape(-1) for arg in args]
+
+    delta = 0.1
+    limit_low = np.full(x.size, -math.inf)
+    limit_up = np.full(x.size, math.inf)
+
+    # Indices of the active points and their previous one-sided values
+    active = np.arange(0, x.size)
+    limit_low_prev = limit_low.copy()
+    limit_up_prev = limit_up.copy()
+
+    iters = np.zeros(x.size, dtype=int)
+    converged = np.zeros(x.size, dtype=bool)
+    for i in range(0, iter_max + 1):
+        if active.size == 0:
+            break
+
+        delta /= (i + 1)
+        xa = x[active]
+        params = [arg[active] for arg in args]
+        low = np.asarray(f(xa - delta, *params), dtype=float)
+        up = np.asarray(f(xa + delta, *params), dtype=float)
+        limit_low[active] = low
+        limit_up[active] = up
+        iters[active] = i
+
+        done = (np.fabs(low - limit_low_prev) <= toler) \
+            & (np.fabs(up - limit_up_prev) <= toler) \
+            & (np.fabs(up - low) <= toler)
+        converged[active[done]] = True
+
+        keep = ~done
+        active = active[keep]
+        limit_low_prev = low[keep]
+        limit_up_prev = up[keep]
+
+    limit = np.where(np.fabs(limit_up - limit_low) > 10 * toler,
+                     math.nan, limit_low)
+
+    return limit.reshape(shape), iters.reshape(shape), \
+        converged.reshape(shape)
+
+
+def limit_richardson(f, x, toler, iter_max):
+    """Calculate a limit using Richardson extrapolation.
+
+    The function is evaluated over the sequence x -/+ delta, with
+    delta = 0.1 / 2^i, in vectorized calls over blocks of doubling size,
+    and both one-sided sequences are extrapolated to delta = 0 by the
+    Richardson method. The sequence stops where x -/+ delta can no longer
+    be distinguished from 'x' in floating point.
+
+    Args:
+        f (function): vectorized equation f(x).
+        x (float): the value the independent variable is approaching.
+        toler (float): tolerance (stopping criterion).
+        iter_max (int): maximum number of iterations (stopping criterion).
+
+    Returns:
+        limit (float): the limit value.
+        iter (int): number of iterations used by the method.
+        converged (boolean): flag to indicate if the limit was found.
+    """
+    delta = np.ldexp(0.1, -np.arange(0, iter_max + 1))
+    delta = delta[:max(np.count_nonzero((x - delta != x) &
+                                        (x + delta != x)), 1)]
+
+    def evaluate(d):
+        # Row 0 approaches 'x' from below and row 1 from above
+        return np.asarray(f(np.concatenate((x - d, x + d))),
+                          dtype=float).reshape(2, d.size)
+
+    values = evaluate(delta[:2])
+
+    # Last row of the Richardson table, for both sides
+    r_prev = values[:, :1]
+    r = r_prev
+
+    i = 0
+    converged = False
+    for i in range(1, delta.size):
+        if i == values.shape[1]:
+            values = np.hstack((values, evaluate(delta[i:2 * i])))
+
+        r = np.zeros((2, i + 1))
+        r[:, 0] = values[:, i]
+        for k in range(1, i + 1):
+            r[:, k] = r[:, k - 1] + \
+                (r[:, k - 1] - r_prev[:, k - 1]) / (2 ** k - 1)
+
+        if np.all(np.fabs(r[:, i] - r_prev[:, i - 1]) <= toler) \
+           and math.fabs(r[1, i] - r[0, i]) <= toler:
+            converged = True
+            break
+
+        r_prev = r
+
+    limit_low = float(r[0, -1])
+    limit_up = float(r[1, -1])
+
+    if math.fabs(limit_up - limit_low) > 10 * toler:
+        raise ValueError("Two sided limit does not exist.")
+
+    return limit_low, i, converged
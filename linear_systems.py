@@ -111,3 +111,51 @@ def gauss_elimination_pp(a, b):
         print("Info: No unique solution.")
 
     return a
+
+
+def tridiagonal(lower, diag, upper, d):
+    """Solve the tridiagonal linear system Ax=d by the Thomas algorithm.
+
+    No pivoting is done, so the matrix should be diagonally dominant (or
+    symmetric positive definite).
+
+    Args:
+        lower (numpy.ndarray): subdiagonal of A (n-1 values).
+        diag (numpy.ndarray): main diagonal of A (n values).
+        upper (numpy.ndarray): superdiagonal of A (n-1 values).
+        d (numpy.ndarray): d values.
+
+    Returns:
+        x (numpy.ndarray): solution of linear the system.
+    """
+    n = diag.size
+
+    if lower.size != n - 1 or upper.size != n - 1 or d.size != n:
+        raise ValueError("'lower' and 'upper' must have n-1 values and "
+                         "'d' must have n values.")
+
+    c = np.zeros(n)
+    b = d.astype(float)
+
+    # Elimination of the subdiagonal
+    for i in range(0, n):
+        m = diag[i]
+        if i > 0:
+            m = m - lower[i - 1] * c[i - 1]
+            b[i] = b[i] - lower[i - 1] * b[i - 1]
+
+        if m == 0:
+            raise ValueError("Null pivot, the system cannot be solved "
+                             "without pivoting.")
+
+        if i < n - 1:
+            c[i] = upper[i] / m
+        b[i] = b[i] / m
+
+    # Backward substitution
+    x = np.zeros(n)
+    x[n - 1] = b[n - 1]
+    for i in range(n - 2, -1, -1):
+        x[i] = b[i] - c[i] * x[i + 1]
+
+    return x
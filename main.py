@@ -6,11 +6,13 @@ Author: Cristiano Fraga G. Nunes <cfgnunes@gmail.com>
 The minimum required Python version is 3.6.
 """
 
+import cmath
 import math
 
 import numpy as np
 
 import differentiation
+import evaluation
 import integration
 import interpolation
 import limits
@@ -55,6 +57,53 @@ def example_limit_epsilon_delta():
     print(f"converged = {converged}")
 
 
+@print_docstring
+def example_limit_epsilon_delta_batch():
+    """Run an example 'Limits: epsilon-delta definition (batch)'."""
+    def f(x):
+        return np.sin(x) / x
+
+    x = np.array([0.0, 1.0, 2.0, 3.0])
+    toler = 10 ** -5
+    iter_max = 100
+
+    print("Inputs:")
+    print(f"x = {x}")
+    print(f"toler = {toler}")
+    print(f"iter_max = {iter_max}")
+
+    limit, i, converged = limits.limit_epsilon_delta_batch(
+        f, x, toler, iter_max)
+
+    print("Output:")
+    print(f"limit = {limit}")
+    print(f"i = {i}")
+    print(f"converged = {converged}")
+
+
+@print_docstring
+def example_limit_richardson():
+    """Run an example 'Limits: Richardson extrapolation'."""
+    def f(x):
+        return np.sin(x) / x
+
+    x = 0
+    toler = 10 ** -5
+    iter_max = 20
+
+    print("Inputs:")
+    print(f"x = {x}")
+    print(f"toler = {toler}")
+    print(f"iter_max = {iter_max}")
+
+    limit, i, converged = limits.limit_richardson(f, x, toler, iter_max)
+
+    print("Output:")
+    print(f"limit = {limit:.5f}")
+    print(f"i = {i}")
+    print(f"converged = {converged}")
+
+
 @print_docstring
 def example_solution_bisection():
     """Run an example 'Solutions: Bisection'."""
@@ -84,7 +133,8 @@ def example_solution_bisection():
     print(f"iter_max = {iter_max}")
 
     print("Execution:")
-    root, i, converged = solutions.bisection(f, a, b, toler, iter_max)
+    root, i, converged = solutions.bisection(
+        f, a, b, toler, iter_max, callback=solutions.print_iteration)
 
     print("Output:")
     print(f"root = {root:.5f}")
@@ -92,6 +142,64 @@ def example_solution_bisection():
     print(f"converged = {converged}")
 
 
+@print_docstring
+def example_solution_bisection_batch():
+    """Run an example 'Solutions: Bisection (batch)'."""
+    # Find the cube root of several values at once: x^3 - c = 0
+    # (the root for c = 30 is outside [0, 3], so it is not found)
+    c = np.array([2.0, 3.0, 5.0, 10.0, 30.0])
+
+    def f(x, c):
+        return x ** 3 - c
+
+    a = np.zeros(c.size)
+    b = np.full(c.size, 3.0)
+    toler = 0.01
+    iter_max = 100
+
+    print("Inputs:")
+    print(f"c = {c}")
+    print(f"a = {a}")
+    print(f"b = {b}")
+    print(f"toler = {toler}")
+    print(f"iter_max = {iter_max}")
+
+    root, i, converged = solutions.bisection_batch(f, a, b, toler, iter_max,
+                                                   args=(c,))
+
+    print("Output:")
+    print(f"root = {root}")
+    print(f"i = {i}")
+    print(f"converged = {converged}")
+
+
+@print_docstring
+def example_solution_find_all_roots():
+    """Run an example 'Solutions: Find all roots'."""
+    def f(x):
+        return np.sin(3 * x) - x / 2
+
+    a = -3.0
+    b = 3.0
+    n = 50
+    toler = 0.01
+    iter_max = 100
+
+    print("Inputs:")
+    print(f"a = {a}")
+    print(f"b = {b}")
+    print(f"n = {n}")
+    print(f"toler = {toler}")
+    print(f"iter_max = {iter_max}")
+
+    root, i, converged = solutions.find_all_roots(f, a, b, n, toler, iter_max)
+
+    print("Output:")
+    print(f"root = {root}")
+    print(f"i = {i}")
+    print(f"converged = {converged}")
+
+
 @print_docstring
 def example_solution_secant():
     """Run an example 'Solutions: Secant'."""
@@ -121,7 +229,8 @@ def example_solution_secant():
     print(f"iter_max = {iter_max}")
 
     print("Execution:")
-    root, i, converged = solutions.secant(f, a, b, toler, iter_max)
+    root, i, converged = solutions.secant(
+        f, a, b, toler, iter_max, callback=solutions.print_iteration)
 
     print("Output:")
     print(f"root = {root:.5f}")
@@ -148,7 +257,8 @@ def example_solution_regula_falsi():
     print(f"iter_max = {iter_max}")
 
     print("Execution:")
-    root, i, converged = solutions.regula_falsi(f, a, b, toler, iter_max)
+    root, i, converged = solutions.regula_falsi(
+        f, a, b, toler, iter_max, callback=solutions.print_iteration)
 
     print("Output:")
     print(f"root = {root:.5f}")
@@ -175,7 +285,8 @@ def example_solution_pegasus():
     print(f"iter_max = {iter_max}")
 
     print("Execution:")
-    root, i, converged = solutions.pegasus(f, a, b, toler, iter_max)
+    root, i, converged = solutions.pegasus(
+        f, a, b, toler, iter_max, callback=solutions.print_iteration)
 
     print("Output:")
     print(f"root = {root:.5f}")
@@ -202,7 +313,8 @@ def example_solution_muller():
     print(f"iter_max = {iter_max}")
 
     print("Execution:")
-    root, i, converged = solutions.muller(f, a, b, toler, iter_max)
+    root, i, converged = solutions.muller(
+        f, a, b, toler, iter_max, callback=solutions.print_iteration)
 
     print("Output:")
     print(f"root = {root:.5f}")
@@ -210,6 +322,52 @@ def example_solution_muller():
     print(f"converged = {converged}")
 
 
+@print_docstring
+def example_solution_brent():
+    """Run an example 'Solutions: Brent'."""
+    # Brent method (find roots of an equation)
+    #   Pros:
+    #       It has guaranteed convergence, like the Bisection method;
+    #       It usually converges as fast as the Secant method;
+    #       There is no need to calculate the derivative of the function.
+    #   Cons:
+    #       The interval reported must have a signal exchange, f (a) * f (b)<0.
+
+    def f(x):
+        return 2 * x ** 3 - math.cos(x + 1) - 3
+
+    a = -1.0
+    b = 2.0
+    toler = 0.01
+    iter_max = 100
+
+    print("Inputs:")
+    print(f"a = {a}")
+    print(f"b = {b}")
+    print(f"toler = {toler}")
+    print(f"iter_max = {iter_max}")
+
+    print("Execution:")
+    root, i, converged, n_eval = solutions.brent(
+        f, a, b, toler, iter_max, callback=solutions.print_iteration)
+
+    print("Output:")
+    print(f"root = {root:.5f}")
+    print(f"i = {i}")
+    print(f"converged = {converged}")
+    print(f"n_eval = {n_eval}")
+
+    # A tight tolerance only needs a few more evaluations
+    toler = 10 ** -10
+    root, i, converged, n_eval = solutions.brent(f, a, b, toler, iter_max)
+
+    print(f"Output (toler = {toler}):")
+    print(f"root = {root:.10f}")
+    print(f"i = {i}")
+    print(f"converged = {converged}")
+    print(f"n_eval = {n_eval}")
+
+
 @print_docstring
 def example_solution_newton():
     """Run an example 'Solutions: Newton'."""
@@ -238,7 +396,34 @@ def example_solution_newton():
     print(f"iter_max = {iter_max}")
 
     print("Execution:")
-    root, i, converged = solutions.newton(f, df, x0, toler, iter_max)
+    root, i, converged = solutions.newton(
+        f, df, x0, toler, iter_max, callback=solutions.print_iteration)
+
+    print("Output:")
+    print(f"root = {root:.5f}")
+    print(f"i = {i}")
+    print(f"converged = {converged}")
+
+
+@print_docstring
+def example_solution_newton_complex_step():
+    """Run an example 'Solutions: Newton (complex-step derivative)'."""
+    # The derivative is not given, so 'f' must accept complex values
+    def f(x):
+        return 2 * x ** 3 - cmath.cos(x + 1) - 3
+
+    x0 = 1.0
+    toler = 0.01
+    iter_max = 100
+
+    print("Inputs:")
+    print(f"x0 = {x0}")
+    print(f"toler = {toler}")
+    print(f"iter_max = {iter_max}")
+
+    print("Execution:")
+    root, i, converged = solutions.newton(
+        f, None, x0, toler, iter_max, callback=solutions.print_iteration)
 
     print("Output:")
     print(f"root = {root:.5f}")
@@ -246,6 +431,93 @@ def example_solution_newton():
     print(f"converged = {converged}")
 
 
+@print_docstring
+def example_solution_newton_batch():
+    """Run an example 'Solutions: Newton (batch)'."""
+    # Find the cube root of several values at once: x^3 - c = 0
+    c = np.array([2.0, 3.0, 5.0, 10.0])
+
+    def f(x, c):
+        return x ** 3 - c
+
+    def df(x, c):
+        return 3 * x ** 2
+
+    x0 = np.ones(c.size)
+    toler = 0.01
+    iter_max = 100
+
+    print("Inputs:")
+    print(f"c = {c}")
+    print(f"x0 = {x0}")
+    print(f"toler = {toler}")
+    print(f"iter_max = {iter_max}")
+
+    root, i, converged = solutions.newton_batch(f, df, x0, toler, iter_max,
+                                                args=(c,))
+
+    print("Output:")
+    print(f"root = {root}")
+    print(f"i = {i}")
+    print(f"converged = {converged}")
+
+
+@print_docstring
+def example_solution_continuation():
+    """Run an example 'Solutions: Continuation'."""
+    # Find the roots of x^3 + x - p = 0 for several values of 'p'
+    def f(x, p):
+        return x ** 3 + x - p
+
+    def df(x, p):
+        return 3 * x ** 2 + 1
+
+    p = np.linspace(1.0, 2.0, 6)
+    x0 = 1.0
+    toler = 0.01
+    iter_max = 100
+
+    print("Inputs:")
+    print(f"p = {p}")
+    print(f"x0 = {x0}")
+    print(f"toler = {toler}")
+    print(f"iter_max = {iter_max}")
+
+    root, i, converged = solutions.continuation(f, df, p, x0, toler, iter_max)
+
+    print("Output:")
+    print(f"root = {root}")
+    print(f"i = {i}")
+    print(f"converged = {converged}")
+
+
+@print_docstring
+def example_solution_solve_many():
+    """Run an example 'Solutions: Solve many equations in parallel'."""
+    toler = 0.01
+    iter_max = 100
+    jobs = [(math.cos, 1.0, 2.0, toler, iter_max),
+            (math.sin, 3.0, 4.0, toler, iter_max),
+            (math.cos, 4.0, 5.0, toler, iter_max),
+            (math.sin, 1.0, 2.0, toler, iter_max)]
+
+    print("Inputs:")
+    for job in jobs:
+        print(f"f = {job[0].__name__}, a = {job[1]}, b = {job[2]}")
+    print(f"toler = {toler}")
+    print(f"iter_max = {iter_max}")
+
+    results = solutions.solve_many(solutions.bisection, jobs, workers=2)
+
+    print("Output:")
+    for result in results:
+        if isinstance(result, Exception):
+            print(f"error = {result}")
+        else:
+            root, i, converged = result
+            print(f"root = {root:.5f}, i = {i}, converged = {converged}")
+
+
 @print_docstring
 def example_interpolation_lagrange():
     """Run an example 'Interpolation: Lagrange'."""
@@ -264,6 +536,26 @@ def example_interpolation_lagrange():
     print(f"y_int = {y_int:.5f}")
 
 
+@print_docstring
+def example_interpolation_barycentric_lagrange():
+    """Run an example 'Interpolation: Lagrange (barycentric form)'."""
+    x = np.array([2, 11 / 4, 4])
+    y = np.array([1 / 2, 4 / 11, 1 / 4])
+    x_int = np.array([2.5, 3.0, 3.5])
+
+    print("Inputs:")
+    print(f"x = {x}")
+    print(f"y = {y}")
+    print(f"x_int = {x_int}")
+
+    p = interpolation.BarycentricLagrange(x, y)
+    y_int = p(x_int)
+
+    print("Output:")
+    print(f"w = {p.w}")
+    print(f"y_int = {y_int}")
+
+
 @print_docstring
 def example_interpolation_newton():
     """Run an example 'Interpolation: Newton'."""
@@ -282,6 +574,58 @@ def example_interpolation_newton():
     print(f"y_int = {y_int:.5f}")
 
 
+@print_docstring
+def example_interpolation_newton_interpolant():
+    """Run an example 'Interpolation: Newton (cached, adding nodes)'."""
+    x = np.array([0.1, 0.3, 0.4, 0.6])
+    y = np.array([0.3162, 0.5477, 0.6325, 0.7746])
+    x_new = 0.7
+    y_new = 0.8367
+    x_int = np.array([0.2, 0.5])
+
+    print("Inputs:")
+    print(f"x = {x}")
+    print(f"y = {y}")
+    print(f"x_new = {x_new}")
+    print(f"y_new = {y_new}")
+    print(f"x_int = {x_int}")
+
+    p = interpolation.NewtonInterpolant(x, y)
+    p.add_point(x_new, y_new)
+    y_int = p(x_int)
+
+    print("Output:")
+    print(f"coef = {p.coef}")
+    print(f"y_int = {y_int}")
+
+
+@print_docstring
+def example_interpolation_chebyshev():
+    """Run an example 'Interpolation: Chebyshev'."""
+    def f(x):
+        return 1 / (1 + 25 * x ** 2)
+
+    a = -1.0
+    b = 1.0
+    toler = 10 ** -10
+    x_int = np.array([-0.9, 0.3, 0.75])
+
+    print("Inputs:")
+    print(f"a = {a}")
+    print(f"b = {b}")
+    print(f"toler = {toler}")
+    print(f"x_int = {x_int}")
+
+    p = interpolation.ChebyshevInterpolant(f, a, b, toler)
+    y_int = p(x_int)
+
+    print("Output:")
+    print(f"degree = {p.coef.size - 1}")
+    print(f"n_eval = {p.n_eval}")
+    print(f"converged = {p.converged}")
+    print(f"y_int = {y_int}")
+
+
 @print_docstring
 def example_interpolation_gregory_newton():
     """Run an example 'Interpolation: Gregory-Newton'."""
@@ -300,6 +644,29 @@ def example_interpolation_gregory_newton():
     print(f"y_int = {y_int:.5f}")
 
 
+@print_docstring
+def example_interpolation_gregory_newton_interpolant():
+    """Run an example 'Interpolation: Gregory-Newton (sliding window)'."""
+    x = np.array([110, 120, 130])
+    y = np.array([2.0410, 2.0790, 2.1140])
+    y_new = 2.1461
+    x_int = np.array([125, 135])
+
+    print("Inputs:")
+    print(f"x = {x}")
+    print(f"y = {y}")
+    print(f"y_new = {y_new}")
+    print(f"x_int = {x_int}")
+
+    p = interpolation.GregoryNewtonInterpolant(x, y)
+    p.slide(y_new)
+    y_int = p(x_int)
+
+    print("Output:")
+    print(f"coef = {p.coef}")
+    print(f"y_int = {y_int}")
+
+
 @print_docstring
 def example_interpolation_neville():
     """Run an example 'Interpolation: Neville'."""
@@ -319,6 +686,64 @@ def example_interpolation_neville():
     print(f"q =\n{q}")
 
 
+@print_docstring
+def example_interpolation_neville_lean():
+    """Run an example 'Interpolation: Neville (without the matrix)'."""
+    x = np.array([1.0, 1.3, 1.6, 1.9, 2.2])
+    y = np.array([0.7651977, 0.6200860, 0.4554022, 0.2818186, 0.1103623])
+    x_int = np.array([1.1, 1.5, 2.0])
+
+    print("Inputs:")
+    print(f"x = {x}")
+    print(f"y = {y}")
+    print(f"x_int = {x_int}")
+
+    y_int = interpolation.neville(x, y, x_int, table=False)
+
+    print("Output:")
+    print(f"y_int = {y_int}")
+
+
+@print_docstring
+def example_interpolation_piecewise_neville():
+    """Run an example 'Interpolation: Neville (local nodes)'."""
+    x = np.array([1.0, 1.3, 1.6, 1.9, 2.2])
+    y = np.array([0.7651977, 0.6200860, 0.4554022, 0.2818186, 0.1103623])
+    x_int = np.array([1.1, 1.5, 2.0])
+    k = 3
+
+    print("Inputs:")
+    print(f"x = {x}")
+    print(f"y = {y}")
+    print(f"x_int = {x_int}")
+    print(f"k = {k}")
+
+    y_int = interpolation.piecewise_neville(x, y, x_int, k)
+
+    print("Output:")
+    print(f"y_int = {y_int}")
+
+
+@print_docstring
+def example_interpolation_cubic_spline():
+    """Run an example 'Interpolation: Cubic spline'."""
+    x = np.array([1.0, 1.3, 1.6, 1.9, 2.2])
+    y = np.array([0.7651977, 0.6200860, 0.4554022, 0.2818186, 0.1103623])
+    x_int = np.array([1.1, 1.5, 2.0])
+
+    print("Inputs:")
+    print(f"x = {x}")
+    print(f"y = {y}")
+    print(f"x_int = {x_int}")
+
+    for bc in ("natural", "not-a-knot"):
+        spline = interpolation.CubicSpline(x, y, bc)
+        y_int = spline(x_int)
+
+        print(f"Output ({bc}):")
+        print(f"y_int = {y_int}")
+
+
 @print_docstring
 def example_polynomial_root_limits():
     """Run an example 'Polynomials: Root limits'."""
@@ -350,6 +775,100 @@ def example_polynomial_briot_ruffini():
     print(f"rest = {rest}")
 
 
+@print_docstring
+def example_polynomial_horner():
+    """Run an example 'Polynomials: Horner (many polynomials)'."""
+    c = np.array([[1, 2, -13, -14, 24], [2, 0, -3, 3, -4]])
+    x = np.array([-2.0, 0.0, 1.0, 2.5])
+
+    print("Inputs:")
+    print(f"c =\n{c}")
+    print(f"x = {x}")
+
+    y, dy = polynomials.horner(c, x, derivative=True)
+
+    print("Output:")
+    print(f"y =\n{y}")
+    print(f"dy =\n{dy}")
+
+
+@print_docstring
+def example_polynomial_aberth():
+    """Run an example 'Polynomials: Aberth-Ehrlich (all the roots)'."""
+    c = np.array([1, 2, -13, -14, 24])
+    toler = 10 ** -10
+    iter_max = 100
+
+    print("Inputs:")
+    print(f"c = {c}")
+    print(f"toler = {toler}")
+    print(f"iter_max = {iter_max}")
+
+    roots, i, converged = polynomials.aberth(c, toler, iter_max)
+
+    print("Output:")
+    print(f"roots = {np.sort_complex(roots)}")
+    print(f"i = {i}")
+    print(f"converged = {converged}")
+
+
+@print_docstring
+def example_polynomial_arithmetic():
+    """Run an example 'Polynomials: Multiplication and division'."""
+    a = polynomials.Polynomial([1, 2, -13, -14, 24])
+    b = polynomials.Polynomial([1, 0, 3])
+
+    print("Inputs:")
+    print(f"a = {a}")
+    print(f"b = {b}")
+
+    q, r = divmod(a, b)
+
+    print("Output:")
+    print(f"a * b = {a * b}")
+    print(f"q = {q}")
+    print(f"r = {r}")
+
+
+@print_docstring
+def example_polynomial_sturm():
+    """Run an example 'Polynomials: Sturm sequence (count of real roots)'."""
+    c = np.array([[1, 2, -13, -14, 24], [1, 0, 0, 0, 1], [1, 0, -1, 0, 0]])
+    a = 0.0
+    b = np.inf
+
+    print("Inputs:")
+    print(f"c =\n{c}")
+    print(f"a = {a}")
+    print(f"b = {b}")
+
+    count = polynomials.sturm_count(c, a, b)
+    brackets = polynomials.sturm_isolate(c, a, b)
+
+    print("Output:")
+    print(f"count = {count}")
+    for k, bracket in enumerate(brackets):
+        print(f"brackets (polynomial {k}) =\n{bracket}")
+
+
+@print_docstring
+def example_polynomial_sturm_integer_roots():
+    """Run an example 'Polynomials: Sturm sequence (roots 1, 2, ..., 16)'."""
+    c = np.poly(np.arange(1, 17))
+    a = 0.0
+    b = 17.0
+
+    print("Inputs:")
+    print(f"c = {c}")
+    print(f"a = {a}")
+    print(f"b = {b}")
+
+    count = polynomials.sturm_count(c, a, b)
+
+    print("Output:")
+    print(f"count = {count}")
+
+
 @print_docstring
 def example_polynomial_newton_divided_difference():
     """Run an example 'Polynomials: Newton's Divided-Difference'."""
@@ -360,7 +879,7 @@ def example_polynomial_newton_divided_difference():
     print(f"x = {x}")
     print(f"y = {y}")
 
-    f = polynomials.newton_divided_difference(x, y)
+    f = polynomials.newton_divided_difference(x, y, verbose=True)
 
     print("Output:")
     print(f"f = {f}")
@@ -705,6 +1224,26 @@ def example_forward_substitution():
     print(f"x = {x}")
 
 
+@print_docstring
+def example_tridiagonal():
+    """Run an example 'Linear Systems: Tridiagonal (Thomas algorithm)'."""
+    lower = np.array([1, 1, 1])
+    diag = np.array([4, 4, 4, 4])
+    upper = np.array([1, 1, 1])
+    d = np.array([5, 6, 6, 5])
+
+    print("Inputs:")
+    print(f"lower = {lower}")
+    print(f"diag = {diag}")
+    print(f"upper = {upper}")
+    print(f"d = {d}")
+
+    x = linear_systems.tridiagonal(lower, diag, upper, d)
+
+    print("Output:")
+    print(f"x = {x}")
+
+
 @print_docstring
 def example_jacobi():
     """Run an example 'Iterative Linear Systems: Jacobi'."""
@@ -753,30 +1292,106 @@ def example_gauss_seidel():
     print(f"i = {i}")
 
 
+@print_docstring
+def example_cached_function():
+    """Run an example 'Evaluation: Cached function'."""
+    def f(x):
+        return 2 * x ** 3 - math.cos(x + 1) - 3
+
+    cached_f = evaluation.CachedFunction(f, maxsize=128)
+    a = -1.0
+    b = 2.0
+    toler = 0.01
+    iter_max = 100
+
+    print("Inputs:")
+    print(f"a = {a}")
+    print(f"b = {b}")
+    print(f"toler = {toler}")
+    print(f"iter_max = {iter_max}")
+
+    # The second call reuses the evaluations of the first one
+    root, _, _ = solutions.secant(cached_f, a, b, toler, iter_max)
+    root, _, _ = solutions.secant(cached_f, a, b, toler, iter_max)
+
+    print("Output:")
+    print(f"root = {root:.5f}")
+    print(f"hits = {cached_f.hits}")
+    print(f"misses = {cached_f.misses}")
+
+
+@print_docstring
+def example_profiler():
+    """Run an example 'Evaluation: Profiler'."""
+    profiler = evaluation.Profiler()
+
+    def f(x):
+        return 2 * x ** 3 - math.cos(x + 1) - 3
+
+    def df(x):
+        return 12 * x ** 2 + 1 - math.sin(x)
+
+    a = np.array([[10, -1, 2, 0], [-1, 11, -1, 3],
+                  [2, -1, 10, -1], [0, 3, -1, 8]])
+    b = np.array([6, 25, -11, 15])
+    x0 = np.array([0, 0, 0, 0])
+
+    with profiler:
+        solutions.newton(profiler.wrap(f), profiler.wrap(df), 1.0, 0.01, 100)
+        solutions.bisection(profiler.wrap(f), -1.0, 2.0, 0.01, 100)
+        integration.romberg(profiler.wrap(f), 0.0, 2.0, 8)
+        jacobi = profiler.wrap(linear_systems_iterative.jacobi)
+        jacobi(a, b, x0, 10 ** -3, 10)
+
+    print("Output:")
+    print(f"stats = {profiler.as_dict()}")
+
+
 def main():
     """Run the main function."""
     # Execute all examples
 
     # Limits
     example_limit_epsilon_delta()
+    example_limit_epsilon_delta_batch()
+    example_limit_richardson()
 
     # Solutions of equations
     example_solution_bisection()
+    example_solution_bisection_batch()
+    example_solution_find_all_roots()
     example_solution_secant()
     example_solution_regula_falsi()
     example_solution_pegasus()
     example_solution_muller()
+    example_solution_brent()
     example_solution_newton()
+    example_solution_newton_complex_step()
+    example_solution_newton_batch()
+    example_solution_continuation()
+    example_solution_solve_many()
 
     # Interpolation
     example_interpolation_lagrange()
+    example_interpolation_barycentric_lagrange()
     example_interpolation_newton()
+    example_interpolation_newton_interpolant()
+    example_interpolation_chebyshev()
     example_interpolation_gregory_newton()
+    example_interpolation_gregory_newton_interpolant()
     example_interpolation_neville()
+    example_interpolation_neville_lean()
+    example_interpolation_piecewise_neville()
+    example_interpolation_cubic_spline()
 
     # Algorithms for polynomials
     example_polynomial_root_limits()
     example_polynomial_briot_ruffini()
+    example_polynomial_horner()
+    example_polynomial_aberth()
+    example_polynomial_arithmetic()
+    example_polynomial_sturm()
+    example_polynomial_sturm_integer_roots()
     example_polynomial_newton_divided_difference()
 
     # Numerical differentiation
@@ -804,11 +1419,16 @@ def main():
     a = example_gauss_elimination_pp()
     example_backward_substitution(a)
     example_forward_substitution()
+    example_tridiagonal()
 
     # Iterative Methods for Linear Systems
     example_jacobi()
     example_gauss_seidel()
 
+    # Evaluation of functions
+    example_cached_function()
+    example_profiler()
+
 
 if __name__ == '__main__':
     main()
@@ -31,7 +31,114 @@ def briot_ruffini(a, root):
     return b, rest
 
 
-def newton_divided_difference(x, y):
+def horner(c, x, derivative=False):
+    """Evaluate polynomials by Horner's method.
+
+    Every polynomial is evaluated at every value at the same time.
+
+    Args:
+        c (numpy.ndarray): polynomial coefficients, in descending order of
+            the powers. A 2-D array holds one polynomial in each row.
+        x (float or numpy.ndarray): values where the polynomials are
+            evaluated (they may be complex).
+        derivative (boolean): flag to also evaluate the first derivative.
+
+    Returns:
+        y (numpy.ndarray): values of the polynomials, with shape
+            c.shape[:-1] + x.shape.
+        dy (numpy.ndarray): values of the derivatives (only if
+            'derivative' is True).
+    """
+    # The first axis indexes the powers, the coefficients broadcast
+    # against the values
+    c = np.moveaxis(np.asarray(c, dtype=float), -1, 0)
+    x = np.asarray(x)
+    c = c.reshape(c.shape + (1,) * x.ndim)
+
+    y = c[0] * np.ones(x.shape)
+    dy = np.zeros(y.shape)
+    for k in range(1, c.shape[0]):
+        if derivative:
+            dy = dy * x + y
+        y = y * x + c[k]
+
+    if derivative:
+        return y, dy
+    return y
+
+
+def aberth(c, toler, iter_max):
+    """Find all the roots of a polynomial by the Aberth-Ehrlich method.
+
+    All the roots, real and complex, are refined at the same time from
+    initial guesses spread on a circle. The roots that have converged are
+    frozen by a mask.
+
+    Args:
+        c (numpy.ndarray): polynomial coefficients.
+        toler (float): tolerance (stopping criterion).
+        iter_max (int): maximum number of iterations (stopping criterion).
+
+    Returns:
+        roots (numpy.ndarray): roots of the polynomial (complex values).
+        iter (int): number of iterations used by the method.
+        converged (numpy.ndarray): flags to indicate if each root was found.
+    """
+    c = np.trim_zeros(np.asarray(c, dtype=float), "f")
+
+    if c.size == 0:
+        raise ValueError("The polynomial is null.")
+
+    # Null roots are removed, so that the polynomial is deflated
+    c_nonzero = np.trim_zeros(c, "b")
+    n_zero = c.size - c_nonzero.size
+    c = c_nonzero
+    n = c.size - 1
+
+    # Initial guesses, on a circle whose radius is the geometric mean of
+    # the moduli of the roots
+    radius = math.fabs(c[-1] / c[0]) ** (1 / n) if n > 0 else 0
+    z = radius * np.exp(1j * (2 * np.pi * np.arange(0, n) / n + 0.4))
+
+    eps = 2.0 ** -52
+    converged = np.zeros(n, dtype=bool)
+    i = 0
+    for i in range(1, iter_max + 1):
+        active = ~converged
+        za = z[active]
+
+        # Newton correction p(z)/p'(z). For |z| > 1 the reversed
+        # polynomial is evaluated at 1/z, which avoids overflow.
+        newton = np.zeros(za.size, dtype=complex)
+        noise = np.zeros(za.size, dtype=bool)
+        small = np.abs(za) <= 1
+        y, dy = horner(c, za[small], derivative=True)
+        newton[small] = y / dy
+        noise[small] = np.abs(y) <= eps * horner(np.abs(c), np.abs(za[small]))
+        w = 1 / za[~small]
+        y, dy = horner(c[::-1], w, derivative=True)
+        newton[~small] = 1 / (n * w - w ** 2 * dy / y)
+        noise[~small] = np.abs(y) <= eps * horner(np.abs(c[::-1]), np.abs(w))
+
+        # Aberth correction, from the repulsion of the other roots
+        diff = za[:, None] - z[None, :]
+        diff[diff == 0] = np.inf
+        repulsion = np.sum(1 / diff, axis=1)
+        delta_z = newton / (1 - newton * repulsion)
+        z[active] = za - delta_z
+
+        # The roots also stop when p(z) is below its rounding error
+        converged[active] = noise | (np.abs(delta_z) <=
+                                     toler * np.maximum(1, np.abs(z[active])))
+        if np.all(converged):
+            break
+
+    roots = np.concatenate((z, np.zeros(n_zero, dtype=complex)))
+    converged = np.concatenate((converged, np.ones(n_zero, dtype=bool)))
+    return roots, i, converged
+
+
+def newton_divided_difference(x, y, verbose=False):
     """Find the coefficients of Newton's divided difference.
 
     Also, find Newton's polynomial.
@@ -39,33 +146,28 @@ def newton_divided_difference(x, y):
     Args:
         x (numpy.ndarray): x values.
         y (numpy.ndarray): y values.
+        verbose (boolean): flag to print Newton's polynomial.
 
     Returns:
         f (numpy.ndarray): Newton's divided difference coefficients.
     """
     n = x.size
-    q = np.zeros((n, n - 1))
 
-    # Insert 'y' in the first column of the matrix 'q'
-    q = np.concatenate((y[:, None], q), axis=1)
-
-    for i in range(1, n):
-        for j in range(1, i + 1):
-            q[i, j] = (q[i, j - 1] - q[i - 1, j - 1]) / (x[i] - x[i - j])
-
-    # Copy the diagonal values of the matrix q to the vector f
-    f = np.zeros(n)
-    for i in range(0, n):
-        f[i] = q[i, i]
-
-    # Prints the polynomial
-    print("The polynomial is:")
-    print(f"p(x)={f[0]:+.3f}", end="")
-    for i in range(1, n):
-        print(f"{f[i]:+.3f}", end="")
-        for j in range(1, i + 1):
-            print(f"(x{(x[j] * -1):+.3f})", end="")
-    print("")
+    # Each column of the divided-difference table overwrites the previous
+    # one, so that the diagonal is left in 'f'
+    f = np.array(y, dtype=float)
+    for j in range(1, n):
+        f[j:] = (f[j:] - f[j - 1:-1]) / (x[j:] - x[:-j])
+
+    if verbose:
+        # Prints the polynomial
+        print("The polynomial is:")
+        print(f"p(x)={f[0]:+.3f}", end="")
+        for i in range(1, n):
+            print(f"{f[i]:+.3f}", end="")
+            for j in range(0, i):
+                print(f"(x{(x[j] * -1):+.3f})", end="")
+        print("")
 
     return f
 
@@ -142,3 +244,374 @@ def root_limits(c):
     lim[0], lim[1], lim[2], lim[3] = 1 / lim[1], lim[0], -lim[2], -1 / lim[3]
 
     return lim
+
+
+def _multiply(a, b, fft_threshold):
+    """Multiply the coefficients of two polynomials.
+
+    Uses the FFT in O(n log n) when both sizes reach 'fft_threshold', and
+    the direct convolution otherwise.
+    """
+    if min(a.size, b.size) < fft_threshold:
+        return np.convolve(a, b)
+
+    n = a.size + b.size - 1
+    size = 1 << (n - 1).bit_length()
+    return np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size),
+                        size)[:n]
+
+
+class Polynomial:
+    """Polynomial with fast multiplication and division.
+
+    Args:
+        c (numpy.ndarray): polynomial coefficients, in descending order of
+            the powers.
+
+    Attributes:
+        c (numpy.ndarray): polynomial coefficients, without leading zeros.
+        fft_threshold (int): minimum size of both operands to multiply by
+            the FFT.
+        refinements (int): number of steps of iterative refinement of the
+            quotient in the division.
+    """
+
+    fft_threshold = 64
+    refinements = 2
+
+    def __init__(self, c):
+        c = np.trim_zeros(np.atleast_1d(np.asarray(c, dtype=float)), "f")
+        self.c = c if c.size > 0 else np.zeros(1)
+
+    @property
+    def degree(self):
+        """Degree of the polynomial (0 for the null polynomial)."""
+        return self.c.size - 1
+
+    def __repr__(self):
+        return f"Polynomial({self.c})"
+
+    def __call__(self, x):
+        return horner(self.c, x)
+
+    def __eq__(self, other):
+        return np.array_equal(self.c, Polynomial._coerce(other).c)
+
+    @staticmethod
+    def _coerce(other):
+        return other if isinstance(other, Polynomial) else Polynomial(other)
+
+    def __add__(self, other):
+        other = Polynomial._coerce(other)
+        n = max(self.c.size, other.c.size)
+        return Polynomial(np.pad(self.c, (n - self.c.size, 0)) +
+                          np.pad(other.c, (n - other.c.size, 0)))
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Polynomial(-self.c)
+
+    def __sub__(self, other):
+        return self + -Polynomial._coerce(other)
+
+    def __rsub__(self, other):
+        return Polynomial._coerce(other) - self
+
+    def __mul__(self, other):
+        other = Polynomial._coerce(other)
+        return Polynomial(_multiply(self.c, other.c, self.fft_threshold))
+
+    __rmul__ = __mul__
+
+    def _inverse(self, k):
+        """Inverse of the reversed polynomial as a power series mod x^k.
+
+        Computed by the Newton iteration g = g (2 - f g), which doubles
+        the number of correct terms at each step.
+        """
+        f = self.c
+        g = np.array([1 / f[0]])
+        n = 1
+        while n < k:
+            n = min(2 * n, k)
+            e = -_multiply(f[:n], g, self.fft_threshold)[:n]
+            e[0] += 2
+            g = _multiply(g, e, self.fft_threshold)[:n]
+        return g
+
+    def __divmod__(self, other):
+        other = Polynomial._coerce(other)
+
+        if not np.any(other.c):
+            raise ZeroDivisionError("Division by the null polynomial.")
+
+        k = self.c.size - other.c.size + 1
+        if k <= 0:
+            return Polynomial(0), Polynomial(self.c)
+
+        # With the coefficients in descending order, the reversed
+        # polynomials are read as power series: rev(Q) = rev(A) / rev(B)
+        g = other._inverse(k)
+        q = np.zeros(k)
+        r = self.c
+        for _ in range(0, 1 + self.refinements):
+            # The leading 'k' coefficients of the remainder must be null,
+            # the residual of the previous step is divided again
+            q = q + _multiply(r[:k], g, self.fft_threshold)[:k]
+            r = self.c - _multiply(other.c, q, self.fft_threshold)
+
+        return Polynomial(q), Polynomial(r[k:])
+
+    def __floordiv__(self, other):
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        return divmod(self, other)[1]
+
+
+def sturm_sequence(c):
+    """Find the Sturm sequence of a polynomial.
+
+    The sequence starts with P(x) and P'(x), and each next polynomial is
+    the negated remainder of the division of the two previous ones. If P(x)
+    has multiple roots, all the polynomials are divided by their greatest
+    common divisor.
+
+    A remainder is taken as null when its maximum modulus is below 1e-8
+    of that of the dividend, so roots closer than about 1e-4 (relative to
+    the spread of the roots) are counted as a single multiple root.
+
+    Args:
+        c (numpy.ndarray): polynomial coefficients.
+
+    Returns:
+        seq (numpy.ndarray): coefficients of the polynomials of the
+            sequence, one in each row, scaled to unit maximum modulus.
+    """
+    c = np.asarray(c, dtype=float)
+    n = c.size - 1
+    seq = np.zeros((n + 1, n + 1))
+
+    p0 = Polynomial(c)
+    p1 = Polynomial(p0.c[:-1] * np.arange(p0.degree, 0, -1))
+    members = [p0, p1]
+    while p1.degree > 0:
+        r = (p0 % p1).c
+        # The remainder is null (multiple roots) when it is negligible next
+        # to the dividend as a whole. Single coefficients are never dropped,
+        # since they may span many orders of magnitude.
+        scale = np.max(np.fabs(r))
+        if scale <= 1e-8 * np.max(np.fabs(p0.c)):
+            break
+        p0, p1 = p1, -Polynomial(r / scale)
+        members.append(p1)
+
+    # With multiple roots the last polynomial is their common divisor,
+    # which is removed so that the sequence also holds at these roots
+    gcd = members[-1]
+    if gcd.degree > 0:
+        members = [member // gcd for member in members]
+
+    for k, member in enumerate(members):
+        scale = np.max(np.fabs(member.c))
+        if scale > 0:
+            seq[k, n + 1 - member.c.size:] = member.c / scale
+
+    return seq
+
+
+def _sturm_sequences(c):
+    """Find the Sturm sequences of many polynomials (one in each row).
+
+    In the generic case each remainder has degree one less than the
+    divisor, so its quotient is linear and all the sequences are built at
+    the same time. The polynomials for which this fails are handled by
+    'sturm_sequence'.
+    """
+    p, size = c.shape
+    n = size - 1
+    seq = np.zeros((p, n + 1, size))
+
+    seq[:, 0] = c
+    if n == 0:
+        return seq
+
+    seq[:, 1, 1:] = c[:, :-1] * np.arange(n, 0, -1)
+    generic = c[:, 0] != 0
+
+    for k in range(2, n + 1):
+        a = seq[:, k - 2]
+        b = seq[:, k - 1]
+        b0 = b[:, k - 1]
+        generic &= b0 != 0
+        b0 = np.where(generic, b0, 1.0)
+
+        # Linear quotient q1 x + q0 and remainder a - (q1 x + q0) b
+        q1 = a[:, k - 2] / b0
+        q0 = (a[:, k - 1] - q1 * b[:, k]) / b0
+        r = a - q0[:, None] * b
+        r[:, :-1] -= q1[:, None] * b[:, 1:]
+        r[:, :k] = 0
+
+        # A null remainder (next to the dividend) means multiple roots
+        scale = np.max(np.fabs(r), axis=1)
+        generic &= scale > 1e-8 * np.max(np.fabs(a), axis=1)
+        seq[:, k] = -r / np.where(scale > 0, scale, 1.0)[:, None]
+
+    for lane in np.nonzero(~generic)[0]:
+        seq[lane] = sturm_sequence(c[lane])
+
+    return seq
+
+
+def _variations(seq, x):
+    """Count the sign variations of Sturm sequences at the values 'x'.
+
+    Args:
+        seq (numpy.ndarray): Sturm sequences, with shape (p, m, n+1).
+        x (float or numpy.ndarray): values, one for each sequence (they
+            may be infinite).
+
+    Returns:
+        v (numpy.ndarray): number of sign variations of each sequence.
+    """
+    x = np.asarray(x, dtype=float) * np.ones(seq.shape[0])
+    finite = np.isfinite(x)
+    xf = np.where(finite, x, 0.0)[:, None]
+
+    # Evaluate the polynomials by Horner's method
+    y = seq[..., 0]
+    for k in range(1, seq.shape[-1]):
+        y = y * xf + seq[..., k]
+
+    # At infinity, the sign is given by the leading coefficient
+    nonzero = seq != 0
+    lead = np.argmax(nonzero, axis=-1)
+    degree = seq.shape[-1] - 1 - lead
+    lead_sign = np.sign(np.take_along_axis(seq, lead[..., None], -1)[..., 0])
+    inf_sign = lead_sign * np.sign(x)[:, None] ** degree
+    s = np.where(finite[:, None], np.sign(y), inf_sign)
+
+    # Null values are skipped, taking the previous nonzero sign
+    m = s.shape[1]
+    idx = np.where(s != 0, np.arange(0, m), 0)
+    idx = np.maximum.accumulate(idx, axis=1)
+    s = np.take_along_axis(s, idx, axis=1)
+
+    return np.count_nonzero(s[:, :-1] * s[:, 1:] < 0, axis=1)
+
+
+def sturm_count(c, a, b):
+    """Count the distinct real roots of polynomials in the interval (a, b].
+
+    Using Sturm's theorem, without finding the roots.
+
+    Args:
+        c (numpy.ndarray): polynomial coefficients. A 2-D array holds one
+            polynomial in each row, and all of them are processed at once.
+        a (float): lower limit (may be -numpy.inf).
+        b (float): upper limit (may be numpy.inf).
+
+    Returns:
+        count (int or numpy.ndarray): number of distinct real roots of each
+            polynomial in (a, b].
+    """
+    c = np.asarray(c, dtype=float)
+    seq = _sturm_sequences(np.atleast_2d(c))
+    count = _variations(seq, a) - _variations(seq, b)
+    return int(count[0]) if c.ndim == 1 else count
+
+
+def _root_bounds(c):
+    """Find finite lower and upper bounds of the real roots of a polynomial.
+
+    The limits of 'root_limits' are tightened by Fujiwara's bound,
+    |x| <= 2 max |c[i] / c[0]|^(1/i), where they are looser (e.g. when
+    there are no positive or negative roots).
+    """
+    c = np.trim_zeros(c, "f")
+    if c.size <= 1:
+        return -1.0, 1.0
+
+    lim = root_limits(c)
+
+    ratio = np.fabs(c[1:] / c[0])
+    ratio[-1] /= 2
+    bound = 2 * np.max(ratio ** (1 / np.arange(1, c.size)))
+
+    # The lower limit is open, so it must be below the roots
+    lower = np.nextafter(max(lim[2], -bound), -np.inf)
+    upper = min(lim[1], bound)
+    return lower, upper
+
+
+def sturm_isolate(c, a, b, toler=1e-12):
+    """Isolate each distinct real root of polynomials in its own interval.
+
+    The intervals are bisected, all of them at the same time, and the
+    number of roots in each half is counted by Sturm's theorem. Infinite
+    limits are replaced by bounds of the roots, so that the polynomials
+    are only evaluated where they do not overflow.
+
+    Args:
+        c (numpy.ndarray): polynomial coefficients. A 2-D array holds one
+            polynomial in each row, and all of them are processed at once.
+        a (float): lower limit (may be -numpy.inf).
+        b (float): upper limit (may be numpy.inf).
+        toler (float): minimum width of the intervals.
+
+    Returns:
+        brackets (numpy.ndarray or list): intervals (lower, upper], one in
+            each row, in ascending order (a list of them, one for each
+            polynomial, if 'c' is 2-D). Each interval holds one root, except
+            those narrower than 'toler', which may hold several roots closer
+            than 'toler' (see 'sturm_count').
+    """
+    c = np.asarray(c, dtype=float)
+    polys = np.atleast_2d(c)
+    p = polys.shape[0]
+    seq = _sturm_sequences(polys)
+
+    lower = np.full(p, a, dtype=float)
+    upper = np.full(p, b, dtype=float)
+    if not (np.isfinite(a) and np.isfinite(b)):
+        for k in range(0, p):
+            bounds = _root_bounds(polys[k])
+            lower[k] = max(lower[k], bounds[0])
+            upper[k] = min(upper[k], bounds[1])
+
+    # Polynomial of each interval
+    owner = np.arange(0, p)
+    v_lower = _variations(seq, lower)
+    v_upper = _variations(seq, upper)
+    brackets = []
+    owners = []
+
+    while lower.size > 0:
+        count = v_lower - v_upper
+        single = (count == 1) | ((count > 1) & (upper - lower <= toler))
+        brackets.append(np.stack((lower[single], upper[single]), axis=1))
+        owners.append(owner[single])
+
+        # The intervals with several roots are split in half
+        split = (count > 1) & ~single
+        lower, upper, owner = lower[split], upper[split], owner[split]
+        v_lower, v_upper = v_lower[split], v_upper[split]
+        mid = (lower + upper) / 2
+        v_mid = _variations(seq[owner], mid)
+
+        lower = np.concatenate((lower, mid))
+        upper = np.concatenate((mid, upper))
+        owner = np.concatenate((owner, owner))
+        v_lower, v_upper = (np.concatenate((v_lower, v_mid)),
+                            np.concatenate((v_mid, v_upper)))
+
+    brackets = np.concatenate(brackets)
+    owners = np.concatenate(owners)
+    order = np.lexsort((brackets[:, 0], owners))
+    brackets, owners = brackets[order], owners[order]
+
+    if c.ndim == 1:
+        return brackets
+    return np.split(brackets, np.searchsorted(owners, np.arange(1, p)))
@@ -1,9 +1,29 @@
 """Methods for solutions of equations."""
 
+import concurrent.futures
+import concurrent.futures.process
 import math
 
+import numpy as np
 
-def bisection(f, a, b, toler, iter_max):
+
+def print_iteration(i, x, fx, dx):
+    """Print the state of an iteration (callback for the root finders).
+
+    Args:
+        i (int): iteration number.
+        x (float): current approximation of the root.
+        fx (float): value of f(x).
+        dx (float): step of the iteration, or None if there is no step.
+    """
+    if dx is None:
+        print(f"i = {i:03d},\tx = {x:+.4f},\tfx = {fx:+.4f}")
+    else:
+        print(f"i = {i:03d},\tx = {x:+.4f},\t", end="")
+        print(f"fx = {fx:+.4f},\tdx = {dx:+.4f}")
+
+
+def bisection(f, a, b, toler, iter_max, callback=None):
     """Calculate the root of an equation by the Bisection method.
 
     Args:
@@ -12,6 +32,8 @@ def bisection(f, a, b, toler, iter_max):
         b (float): upper limit.
         toler (float): tolerance (stopping criterion).
         iter_max (int): maximum number of iterations (stopping criterion).
+        callback (function): optional function callback(i, x, fx, dx)
+            called at each iteration.
 
     Returns:
         root (float): root value.
@@ -33,8 +55,8 @@ def bisection(f, a, b, toler, iter_max):
         x = (a + b) / 2
         fx = f(x)
 
-        print(f"i = {i:03d},\tx = {x:+.4f},\t", end="")
-        print(f"fx = {fx:+.4f},\tdx = {delta_x:+.4f}")
+        if callback is not None:
+            callback(i, x, fx, delta_x)
 
         if delta_x <= toler and math.fabs(fx) <= toler:
             converged = True
@@ -52,7 +74,121 @@ def bisection(f, a, b, toler, iter_max):
     return root, i, converged
 
 
-def secant(f, a, b, toler, iter_max):
+def bisection_batch(f, a, b, toler, iter_max, args=()):
+    """Calculate the roots of an equation by the Bisection method.
+
+    All the intervals [a[k], b[k]] are bisected at the same time. At each
+    iteration 'f' is only evaluated at the lanes still active, whose
+    parameters are given in 'args' and passed along with 'x'. Instead of
+    raising an error, the intervals where 'f' does not change signal get a
+    'nan' root and are not bisected.
+
+    Args:
+        f (function): vectorized equation f(x, *args).
+        a (numpy.ndarray): lower limits.
+        b (numpy.ndarray): upper limits.
+        toler (float): tolerance (stopping criterion).
+        iter_max (int): maximum number of iterations (stopping criterion).
+        args (tuple): parameters of the equation, each one an array with
+            the shape of 'a' (or broadcastable to it).
+
+    Returns:
+        root (numpy.ndarray): root values.
+        iter (numpy.ndarray): number of iterations used in each interval.
+        converged (numpy.ndarray): flags to indicate if each root was found.
+    """
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+
+    if a.shape != b.shape:
+        raise ValueError("'a' and 'b' must have same shape.")
+
+    shape = a.shape
+    a = a.reshape(-1)
+    b = b.reshape(-1)
+    args = [np.broadcast_to(arg, shape).reshape(-1) for arg in args]
+
+    fa = f(a, *args)
+    fb = f(b, *args)
+
+    # Indices of the active lanes, the ones with a signal change
+    active = np.flatnonzero(fa * fb <= 0)
+    a, b, fa = a[active], b[active], fa[active]
+    delta_x = np.fabs(b - a) / 2
+
+    x = np.full(shape, math.nan).reshape(-1)
+    iters = np.zeros(x.size, dtype=int)
+    converged = np.zeros(x.size, dtype=bool)
+    for i in range(0, iter_max + 1):
+        if active.size == 0:
+            break
+
+        xa = (a + b) / 2
+        fx = f(xa, *[arg[active] for arg in args])
+        x[active] = xa
+        iters[active] = i
+
+        done = (delta_x <= toler) & (np.fabs(fx) <= toler)
+        converged[active[done]] = True
+
+        right = fa * fx > 0
+        a = np.where(right, xa, a)
+        fa = np.where(right, fx, fa)
+        b = np.where(right, b, xa)
+        delta_x = delta_x / 2
+
+        keep = ~done
+        active, a, b, fa = active[keep], a[keep], b[keep], fa[keep]
+        delta_x = delta_x[keep]
+
+    root = x.reshape(shape)
+    return root, iters.reshape(shape), converged.reshape(shape)
+
+
+def find_all_roots(f, a, b, n, toler, iter_max):
+    """Calculate all the roots of an equation in the interval [a, b].
+
+    The function is evaluated on a grid of 'n' subintervals. Each
+    subinterval where 'f' changes signal is then refined by the Bisection
+    method, all of them at the same time.
+
+    Roots that do not produce a signal change (e.g. roots of even
+    multiplicity) or that lie closer than the grid spacing may be missed.
+
+    Args:
+        f (function): vectorized equation f(x).
+        a (float): lower limit.
+        b (float): upper limit.
+        n (int): number of subintervals of the grid.
+        toler (float): tolerance (stopping criterion).
+        iter_max (int): maximum number of iterations (stopping criterion).
+
+    Returns:
+        root (numpy.ndarray): root values, in ascending order.
+        iter (numpy.ndarray): number of iterations used for each root.
+        converged (numpy.ndarray): flags to indicate if each root was found.
+    """
+    x = np.linspace(a, b, n + 1)
+    y = f(x)
+
+    # Grid points which are exactly roots
+    zero = y == 0
+    # Subintervals with a signal change
+    change = y[:-1] * y[1:] < 0
+
+    root, iters, converged = bisection_batch(
+        f, x[:-1][change], x[1:][change], toler, iter_max)
+
+    root = np.concatenate((root, x[zero]))
+    iters = np.concatenate((iters, np.zeros(np.count_nonzero(zero), int)))
+    converged = np.concatenate((converged, np.ones(np.count_nonzero(zero),
+                                                   bool)))
+
+    order = np.argsort(root)
+    return root[order], iters[order], converged[order]
+
+
+def secant(f, a, b, toler, iter_max, callback=None):
     """Calculate the root of an equation by the Secant method.
 
     Args:
@@ -61,6 +197,8 @@ def secant(f, a, b, toler, iter_max):
         b (float): upper limit.
         toler (float): tolerance (stopping criterion).
         iter_max (int): maximum number of iterations (stopping criterion).
+        callback (function): optional function callback(i, x, fx, dx)
+            called at each iteration.
 
     Returns:
         root (float): root value.
@@ -89,8 +227,8 @@ def secant(f, a, b, toler, iter_max):
         x += delta_x
         fx = f(x)
 
-        print(f"i = {i:03d},\tx = {x:+.4f},\t", end="")
-        print(f"fx = {fx:+.4f},\tdx = {delta_x:+.4f}")
+        if callback is not None:
+            callback(i, x, fx, delta_x)
 
         if math.fabs(delta_x) <= toler and math.fabs(fx) <= toler:
             converged = True
@@ -103,7 +241,7 @@ def secant(f, a, b, toler, iter_max):
     return root, i, converged
 
 
-def regula_falsi(f, a, b, toler, iter_max):
+def regula_falsi(f, a, b, toler, iter_max, callback=None):
     """Calculate the root of an equation by the Regula Falsi method.
 
     Args:
@@ -112,6 +250,8 @@ def regula_falsi(f, a, b, toler, iter_max):
         b (float): upper limit.
         toler (float): tolerance (stopping criterion).
         iter_max (int): maximum number of iterations (stopping criterion).
+        callback (function): optional function callback(i, x, fx, dx)
+            called at each iteration.
 
     Returns:
         root (float): root value.
@@ -138,8 +278,8 @@ def regula_falsi(f, a, b, toler, iter_max):
         x += delta_x
         fx = f(x)
 
-        print(f"i = {i:03d},\tx = {x:+.4f},\t", end="")
-        print(f"fx = {fx:+.4f},\tdx = {delta_x:+.4f}")
+        if callback is not None:
+            callback(i, x, fx, delta_x)
 
         if math.fabs(delta_x) <= toler and math.fabs(fx) <= toler:
             converged = True
@@ -156,7 +296,7 @@ def regula_falsi(f, a, b, toler, iter_max):
     return root, i, converged
 
 
-def pegasus(f, a, b, toler, iter_max):
+def pegasus(f, a, b, toler, iter_max, callback=None):
     """Calculate the root of an equation by the Pegasus method.
 
     Args:
@@ -165,6 +305,8 @@ def pegasus(f, a, b, toler, iter_max):
         b (float): upper limit.
         toler (float): tolerance (stopping criterion).
         iter_max (int): maximum number of iterations (stopping criterion).
+        callback (function): optional function callback(i, x, fx, dx)
+            called at each iteration.
 
     Returns:
         root (float): root value.
@@ -182,8 +324,8 @@ def pegasus(f, a, b, toler, iter_max):
         x += delta_x
         fx = f(x)
 
-        print(f"i = {i:03d},\tx = {x:+.4f},\t", end="")
-        print(f"fx = {fx:+.4f},\tdx = {delta_x:+.4f}")
+        if callback is not None:
+            callback(i, x, fx, delta_x)
 
         if math.fabs(delta_x) <= toler and math.fabs(fx) <= toler:
             converged = True
@@ -202,7 +344,7 @@ def pegasus(f, a, b, toler, iter_max):
     return root, i, converged
 
 
-def muller(f, a, c, toler, iter_max):
+def muller(f, a, c, toler, iter_max, callback=None):
     """Calculate the root of an equation by the Muller method.
 
     Args:
@@ -211,6 +353,8 @@ def muller(f, a, c, toler, iter_max):
         c (float): upper limit.
         toler (float): tolerance (stopping criterion).
         iter_max (int): maximum number of iterations (stopping criterion).
+        callback (function): optional function callback(i, x, fx, dx)
+            called at each iteration.
 
     Returns:
         root (float): root value.
@@ -244,8 +388,8 @@ def muller(f, a, c, toler, iter_max):
         delta_x = x - t
         fx = f(x)
 
-        print(f"i = {i:03d},\tx = {x:+.4f},\t", end="")
-        print(f"fx = {fx:+.4f},\tdx = {delta_x:+.4f}")
+        if callback is not None:
+            callback(i, x, fx, delta_x)
 
         if math.fabs(delta_x) <= toler and math.fabs(fx) <= toler:
             converged = True
@@ -265,36 +409,158 @@ def muller(f, a, c, toler, iter_max):
     return root, i, converged
 
 
-def newton(f, df, x0, toler, iter_max):
+def brent(f, a, b, toler, iter_max, callback=None):
+    """Calculate the root of an equation by the Brent method.
+
+    Hybrid method that keeps the root bracketed and combines inverse
+    quadratic interpolation and secant steps with a fallback to bisection,
+    so it converges as surely as the Bisection method but usually with far
+    fewer evaluations of 'f'. It stops when the bracket is narrower than
+    'toler' (as the 'zeroin' algorithm), returning its endpoint with the
+    smallest |f(x)|.
+
+    Args:
+        f (function): equation f(x).
+        a (float): lower limit.
+        b (float): upper limit.
+        toler (float): tolerance (stopping criterion).
+        iter_max (int): maximum number of iterations (stopping criterion).
+        callback (function): optional function callback(i, x, fx, dx)
+            called at each iteration.
+
+    Returns:
+        root (float): root value.
+        iter (int): number of iterations used by the method.
+        converged (boolean): flag to indicate if the root was found.
+        n_eval (int): number of evaluations of 'f' used by the method.
+    """
+    fa = f(a)
+    fb = f(b)
+    n_eval = 2
+
+    if fa * fb > 0:
+        raise ValueError("The function does not change signal at \
+              the ends of the given interval.")
+
+    eps = 2.0 ** -52
+    c = b
+    fc = fb
+    d = e = b - a
+
+    converged = False
+    for i in range(0, iter_max + 1):
+        # Keep the root bracketed by [b, c]
+        if fb * fc > 0:
+            c = a
+            fc = fa
+            d = e = b - a
+
+        # 'b' must be the best approximation
+        if math.fabs(fc) < math.fabs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2 * eps * math.fabs(b) + 0.5 * toler
+        xm = (c - b) / 2
+
+        # Stop on the width of the bracket, 'b' is its endpoint with the
+        # smallest |f|
+        if math.fabs(xm) <= tol1 or fb == 0:
+            converged = True
+            break
+
+        if math.fabs(e) >= tol1 and math.fabs(fa) > math.fabs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p = 2 * xm * s
+                q = 1 - s
+            else:
+                # Inverse quadratic interpolation step
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+
+            if p > 0:
+                q = -q
+            p = math.fabs(p)
+
+            # Accept the interpolation only if it falls inside the bracket
+            # and shrinks fast enough, otherwise take a bisection step
+            if 2 * p < min(3 * xm * q - math.fabs(tol1 * q), math.fabs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = e = xm
+        else:
+            d = e = xm
+
+        a = b
+        fa = fb
+        delta_x = d if math.fabs(d) > tol1 else math.copysign(tol1, xm)
+        b += delta_x
+        fb = f(b)
+        n_eval += 1
+
+        if callback is not None:
+            callback(i, b, fb, delta_x)
+
+    root = b
+    return root, i, converged, n_eval
+
+
+def _complex_step(f, x, h=1e-20):
+    """Evaluate f(x) and its derivative by the complex-step method.
+
+    Since f(x + ih) = f(x) + ih f'(x) + O(h^2), one evaluation gives both
+    values, without the subtractive cancellation of finite differences.
+    """
+    fz = f(complex(x, h))
+    return fz.real, fz.imag / h
+
+
+def newton(f, df, x0, toler, iter_max, callback=None):
     """Calculate the root of an equation by the Newton method.
 
     Args:
         f (function): equation f(x).
-        df (function): derivative of quation f(x).
+        df (function): derivative of quation f(x). If None, the derivative
+            is computed by the complex-step method, from the same
+            evaluation of 'f' (then 'f' must accept complex arguments,
+            e.g. using 'cmath' instead of 'math').
         x0 (float): initial guess.
         toler (float): tolerance (stopping criterion).
         iter_max (int): maximum number of iterations (stopping criterion).
+        callback (function): optional function callback(i, x, fx, dx)
+            called at each iteration.
 
     Returns:
         root (float): root value.
         iter (int): number of iterations used by the method.
         converged (boolean): flag to indicate if the root was found.
     """
-    fx = f(x0)
-    dfx = df(x0)
+    if df is None:
+        def f_df(x):
+            return _complex_step(f, x)
+    else:
+        def f_df(x):
+            return f(x), df(x)
+
+    fx, dfx = f_df(x0)
     x = x0
 
-    print(f"i = 000,\tx = {x:+.4f},\tfx = {fx:+.4f}")
+    if callback is not None:
+        callback(0, x, fx, None)
 
     converged = False
     for i in range(1, iter_max + 1):
         delta_x = -fx / dfx
         x += delta_x
-        fx = f(x)
-        dfx = df(x)
+        fx, dfx = f_df(x)
 
-        print(f"i = {i:03d},\tx = {x:+.4f},\t", end="")
-        print(f"fx = {fx:+.4f},\tdx = {delta_x:+.4f}")
+        if callback is not None:
+            callback(i, x, fx, delta_x)
 
         if math.fabs(delta_x) <= toler and math.fabs(fx) <= toler or dfx == 0:
             converged = True
@@ -302,3 +568,232 @@ def newton(f, df, x0, toler, iter_max):
 
     root = x
     return root, i, converged
+
+
+def newton_batch(f, df, x0, toler, iter_max, args=()):
+    """Calculate the roots of an equation by the Newton method.
+
+    All the initial guesses x0[k] are advanced at the same time. At each
+    iteration 'f' and 'df' are only evaluated at the lanes still active,
+    so the lanes that have converged cost nothing. The parameters of each
+    lane are given in 'args' and passed along with 'x'. A lane that
+    reaches a null derivative with |f(x)| > toler is stopped as not
+    converged.
+
+    Args:
+        f (function): vectorized equation f(x, *args).
+        df (function): vectorized derivative of equation f(x, *args).
+        x0 (numpy.ndarray): initial guesses.
+        toler (float): tolerance (stopping criterion).
+        iter_max (int): maximum number of iterations (stopping criterion).
+        args (tuple): parameters of the equation, each one an array with
+            the shape of 'x0' (or broadcastable to it).
+
+    Returns:
+        root (numpy.ndarray): root values.
+        iter (numpy.ndarray): number of iterations used in each lane.
+        converged (numpy.ndarray): flags to indicate if each root was found.
+    """
+    x = np.array(x0, dtype=float)
+    shape = x.shape
+    x = x.reshape(-1)
+    args = [np.broadcast_to(arg, shape).reshape(-1) for arg in args]
+
+    # Indices of the active lanes and their values of f(x) and f'(x)
+    active = np.arange(0, x.size)
+    fx = f(x, *args)
+    dfx = df(x, *args)
+
+    iters = np.zeros(x.size, dtype=int)
+    converged = np.zeros(x.size, dtype=bool)
+    for i in range(1, iter_max + 1):
+        if active.size == 0:
+            break
+
+        # Lanes with a null derivative do not move
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta_x = np.where(dfx != 0, -fx / dfx, 0.0)
+        xa = x[active] + delta_x
+        params = [arg[active] for arg in args]
+        fx = f(xa, *params)
+        dfx = df(xa, *params)
+        x[active] = xa
+        iters[active] = i
+
+        small_fx = np.fabs(fx) <= toler
+        done = small_fx & ((np.fabs(delta_x) <= toler) | (dfx == 0))
+        # Lanes stopped at a null derivative away from a root
+        stalled = ~small_fx & (dfx == 0)
+        converged[active[done]] = True
+
+        keep = ~(done | stalled)
+        active, fx, dfx = active[keep], fx[keep], dfx[keep]
+
+    root = x.reshape(shape)
+    return root, iters.reshape(shape), converged.reshape(shape)
+
+
+def continuation(f, df, p, x0, toler, iter_max, a=None, b=None,
+                 extrapolate=True):
+    """Calculate the roots of a family of equations f(x; p) = 0.
+
+    The parameter values are walked in order and each solution by the
+    Newton method is warm-started from the previous roots. When Newton
+    fails and a bracket [a, b] is given, the root is found by the Brent
+    method instead.
+
+    Args:
+        f (function): equation f(x, p).
+        df (function): derivative of equation f(x, p) with respect to x,
+            or None to compute it as in 'newton'.
+        p (numpy.ndarray): parameter values, sorted.
+        x0 (float): initial guess for the first parameter value.
+        toler (float): tolerance (stopping criterion).
+        iter_max (int): maximum number of iterations (stopping criterion).
+        a (float): lower limit of the fallback bracket (optional).
+        b (float): upper limit of the fallback bracket (optional).
+        extrapolate (boolean): flag to predict the initial guess by linear
+            extrapolation of the two previous roots.
+
+    Returns:
+        root (numpy.ndarray): root values for each parameter value.
+        iter (numpy.ndarray): number of iterations used for each root.
+        converged (numpy.ndarray): flags to indicate if each root was found.
+    """
+    p = np.asarray(p, dtype=float)
+    n = p.size
+    root = np.zeros(n)
+    iters = np.zeros(n, dtype=int)
+    converged = np.zeros(n, dtype=bool)
+
+    x = x0
+    for k in range(0, n):
+        # Predictor
+        if extrapolate and k >= 2 and converged[k - 1] and converged[k - 2]:
+            x = root[k - 1] + (root[k - 1] - root[k - 2]) / \
+                (p[k - 1] - p[k - 2]) * (p[k] - p[k - 1])
+        elif k >= 1 and converged[k - 1]:
+            x = root[k - 1]
+
+        def fp(x, pk=p[k]):
+            return f(x, pk)
+
+        def dfp(x, pk=p[k]):
+            return df(x, pk)
+
+        def fp_real(x, pk=p[k]):
+            # 'f' may return complex values when it supports the complex step
+            return f(x, pk).real
+
+        if df is None:
+            dfp = None
+
+        # Corrector (Newton also stops when the derivative is null, so the
+        # residual is checked before accepting the root)
+        try:
+            root[k], iters[k], converged[k] = newton(
+                fp, dfp, float(x), toler, iter_max)
+            converged[k] = converged[k] and \
+                math.fabs(fp_real(root[k])) <= toler
+        except (ZeroDivisionError, OverflowError):
+            converged[k] = False
+
+        if not converged[k] and a is not None and b is not None \
+           and fp_real(a) * fp_real(b) <= 0:
+            root[k], i, converged[k], _ = brent(fp_real, a, b, toler,
+                                                iter_max)
+            iters[k] += i
+
+    return root, iters, converged
+
+
+def _solve_job(method, job):
+    """Run one job of 'solve_many', returning the exception if it fails."""
+    try:
+        return method(*job)
+    except Exception as error:  # pylint: disable=broad-except
+        return error
+
+
+def _solve_chunk(method, chunk):
+    """Run a chunk of jobs of 'solve_many' in a worker process."""
+    return [_solve_job(method, job) for job in chunk]
+
+
+def _solve_alone(method, job):
+    """Run one job of 'solve_many' in a process of its own."""
+    with concurrent.futures.ProcessPoolExecutor(1) as executor:
+        try:
+            return executor.submit(_solve_job, method, job).result()
+        except Exception as error:  # pylint: disable=broad-except
+            return error
+
+
+def solve_many(method, jobs, workers=None, chunksize=16):
+    """Calculate the roots of many independent equations in parallel.
+
+    The jobs are spread across a pool of processes, so 'method' and the
+    functions inside the jobs must be picklable (e.g. defined at the top
+    level of a module). A job that cannot be sent to or returned from a
+    process, or that kills its process, only fails itself: the jobs of a
+    failed chunk are run again one at a time, and a broken pool is
+    replaced by a new one for the unfinished chunks. The jobs lost with a
+    broken pool are finally run alone, each in its own process, to tell
+    the job that broke it from the others.
+
+    Args:
+        method (function): root finder, e.g. 'bisection' or 'newton'.
+        jobs (list): tuples of arguments of 'method', e.g.
+            (f, a, b, toler, iter_max).
+        workers (int): number of processes (the number of CPUs by default).
+            If 1, the jobs are run in the current process.
+        chunksize (int): number of jobs submitted to a process at once.
+
+    Returns:
+        results (list): the result of 'method' for each job, in the order
+            of 'jobs', or the exception raised by a job that failed (or by
+            its transfer or its process).
+    """
+    jobs = list(jobs)
+
+    if workers == 1:
+        return _solve_chunk(method, jobs)
+
+    broken = concurrent.futures.process.BrokenProcessPool
+    results = [None] * len(jobs)
+    # Chunks of indices of the jobs to be run
+    pending = [list(range(i, min(i + chunksize, len(jobs))))
+               for i in range(0, len(jobs), chunksize)]
+    # Jobs lost with a broken pool, which may have broken it
+    suspects = []
+
+    while pending:
+        chunks, pending = pending, []
+        with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+            submitted = []
+            for chunk in chunks:
+                try:
+                    future = executor.submit(_solve_chunk, method,
+                                             [jobs[k] for k in chunk])
+                except broken as error:
+                    # The pool broke while the chunks were submitted
+                    future = concurrent.futures.Future()
+                    future.set_exception(error)
+                submitted.append((chunk, future))
+
+            for chunk, future in submitted:
+                try:
+                    for k, result in zip(chunk, future.result()):
+                        results[k] = result
+                except Exception as error:  # pylint: disable=broad-except
+                    if len(chunk) > 1:
+                        pending.extend([k] for k in chunk)
+                    elif isinstance(error, broken):
+                        suspects.extend(chunk)
+                    else:
+                        results[chunk[0]] = error
+
+    for k in suspects:
+        results[k] = _solve_alone(method, jobs[k])
+
+    return results